@@ -1,8 +1,160 @@
-import avro.schema
+import fastavro
 import json
 import os
 import argparse
-from typing import Dict, Any, List
+import functools
+import sys
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Dict, Any, Iterator, List, NamedTuple, Optional, Tuple
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
+
+# Valeur sentinelle pour les attributs absents (une valeur par défaut peut valoir None)
+_MISSING = object()
+
+
+@functools.lru_cache(maxsize=128)
+def _parse_schema_cached(schema_bytes: bytes) -> Tuple[Any, Dict[str, Any]]:
+    """
+    Analyse un schéma Avro en mettant le résultat en cache selon son contenu brut
+
+    :param schema_bytes: Contenu brut du fichier de schéma Avro
+    :return: Schéma Avro analysé et dictionnaire de ses types nommés, indexés par nom complet
+    """
+    named_schemas = {}
+    schema = fastavro.parse_schema(_json_loads(schema_bytes), named_schemas)
+    return schema, named_schemas
+
+
+def _json_loads(data: bytes) -> Any:
+    """
+    Désérialise un document JSON, avec orjson lorsqu'il est disponible
+
+    :param data: Document JSON brut
+    :return: Valeur désérialisée
+    """
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            # orjson refuse le BOM UTF-8 et l'UTF-16, que json détecte et accepte
+            pass
+    return json.loads(data)
+
+
+def _json_dumps(value: Any) -> str:
+    """
+    Sérialise une valeur en JSON compact, avec orjson lorsqu'il est disponible
+
+    :param value: Valeur à sérialiser
+    :return: Représentation JSON de la valeur
+    """
+    if orjson is not None:
+        try:
+            return orjson.dumps(value).decode('utf-8')
+        except TypeError:
+            # orjson refuse certaines valeurs (entiers hors 64 bits, ...)
+            pass
+    return json.dumps(value, separators=(',', ':'), ensure_ascii=False)
+
+
+def _get(node: Any, key: str, default: Any = None) -> Any:
+    """
+    Lit une propriété d'un noeud de schéma, qu'il s'agisse d'un dictionnaire (fastavro)
+    ou d'un objet (avro)
+
+    :param node: Noeud du schéma Avro
+    :param key: Nom de la propriété
+    :param default: Valeur renvoyée si la propriété est absente
+    :return: Valeur de la propriété
+    """
+    if isinstance(node, dict):
+        return node.get(key, default)
+    return getattr(node, key, default)
+
+
+def _short_name(fullname: str) -> str:
+    """
+    Retire l'espace de noms d'un nom complet Avro
+
+    :param fullname: Nom complet (ex. com.example.Client)
+    :return: Nom court (ex. Client)
+    """
+    return fullname.rpartition('.')[2]
+
+
+class _FieldPlan(NamedTuple):
+    """
+    Champ d'un record, avec ses rendus Mermaid et Markdown précalculés
+    """
+    name: str
+    mermaid_type: str
+    type_name: str
+    doc: Optional[str]
+    default: Optional[str]
+    link: Optional[str]
+
+
+@dataclass
+class _SchemaPlan:
+    """
+    Représentation à plat du schéma Avro, calculée une seule fois puis parcourue
+    par les générateurs de diagramme et de documentation
+    """
+    name: str
+    namespace: Optional[str]
+    type: str
+    doc: Optional[str]
+    fields: List[_FieldPlan]
+    record_names: List[str]
+    record_docs: List[Optional[str]]
+    record_fields: List[List[_FieldPlan]]
+    enum_names: List[str]
+    enum_docs: List[Optional[str]]
+    enum_symbols: List[List[str]]
+    relations: List[Tuple[str, str, str, str]]
+
+
+# Taille du tampon d'écriture des fichiers de documentation
+_WRITE_BUFFER_SIZE = 1 << 20
+
+# Gabarit d'un bloc de classe du diagramme Mermaid
+_MERMAID_CLASS_TEMPLATE = "    class {name} {{\n{members}    }}\n"
+
+# Natures de relations entre classes, encodées sur les bits de poids faible des clés de relation
+_RELATION_KINDS = {
+    'record': 0,
+    'enum': 1,
+    'record_list': 2,
+    'enum_list': 3,
+    'array_record': 4,
+    'array_enum': 5,
+}
+
+
+# Formateurs des types complexes, indexés par le type Avro du noeud
+_MERMAID_TYPE_FORMATTERS = {
+    'record': lambda generator, type_schema: sys.intern(_short_name(_get(type_schema, 'name'))),
+    'enum': lambda generator, type_schema: sys.intern(_short_name(_get(type_schema, 'name'))),
+    'fixed': lambda generator, type_schema: sys.intern(_short_name(_get(type_schema, 'name'))),
+    'array': lambda generator, type_schema: f"List<{generator._get_single_mermaid_type(_get(type_schema, 'items'))}>",
+    'map': lambda generator, type_schema: f"Map<{generator._get_single_mermaid_type(_get(type_schema, 'values'))}>",
+}
+
+_TYPE_NAME_FORMATTERS = {
+    'record': lambda generator, type_schema: sys.intern(f"Record ({_short_name(_get(type_schema, 'name'))})"),
+    'enum': lambda generator, type_schema: sys.intern(f"Enum ({_short_name(_get(type_schema, 'name'))})"),
+    'fixed': lambda generator, type_schema: sys.intern(f"Fixed ({_short_name(_get(type_schema, 'name'))})"),
+    'array': lambda generator, type_schema: f"Tableau de {generator._get_single_type_name(_get(type_schema, 'items'))}",
+    'map': lambda generator, type_schema: f"Map de {generator._get_single_type_name(_get(type_schema, 'values'))}",
+}
+
 
 class AvroDocumentationGenerator:
     def __init__(self, avro_file_path: str, output_dir: str = 'docs'):
@@ -14,12 +166,12 @@ class AvroDocumentationGenerator:
         """
         self.avro_file_path = avro_file_path
         self.output_dir = output_dir
-        self.schema = avro.schema.parse(open(avro_file_path, 'rb').read())
+        with open(avro_file_path, 'rb') as f:
+            data = f.read()
+        self.schema, self.named_schemas = _parse_schema_cached(data)
         
-        # Dictionnaires pour stocker les sous-objets et enums
-        self.records = {}
-        self.enums = {}
-        self.processed_types = set()
+        # Analyse unique du schéma (sous-objets, enums et relations), partagée par tous les rendus
+        self.plan = self._build_plan()
 
     def generate_mermaid_class_diagram(self) -> str:
         """
@@ -27,122 +179,66 @@ class AvroDocumentationGenerator:
         
         :return: Diagramme de classe Mermaid
         """
-        mermaid_diagram = "```mermaid\nclassDiagram\n"
+        return "".join(self.iter_mermaid_class_diagram())
+
+    def iter_mermaid_class_diagram(self) -> Iterator[str]:
+        """
+        Produit le diagramme de classe Mermaid fragment par fragment
+        
+        :return: Itérateur sur les lignes du diagramme Mermaid
+        """
+        yield "```mermaid\nclassDiagram\n"
+        
+        plan = self.plan
         
         # Ajout des enums
-        for enum_name, enum_schema in self.enums.items():
-            mermaid_diagram += f"    class {enum_name} {{\n"
-            mermaid_diagram += "        <<enumeration>>\n"
-            for symbol in enum_schema.symbols:
-                mermaid_diagram += f"        {symbol}\n"
-            mermaid_diagram += "    }\n"
+        for enum_name, symbols in zip(plan.enum_names, plan.enum_symbols):
+            members = "".join(f"        {symbol}\n" for symbol in symbols)
+            yield _MERMAID_CLASS_TEMPLATE.format(name=enum_name, members="        <<enumeration>>\n" + members)
         
         # Ajout des records
-        for record_name, record_schema in self.records.items():
-            mermaid_diagram += f"    class {record_name} {{\n"
-            for field in record_schema.fields:
-                field_type = self._get_mermaid_field_type(field.type)
-                mermaid_diagram += f"        {field_type} {field.name}\n"
-            mermaid_diagram += "    }\n"
+        for record_name, fields in zip(plan.record_names, plan.record_fields):
+            members = "".join(f"        {field.mermaid_type} {field.name}\n" for field in fields)
+            yield _MERMAID_CLASS_TEMPLATE.format(name=record_name, members=members)
         
         # Ajout des relations principales
-        mermaid_diagram += self._generate_class_relations()
+        yield from self._iter_class_relations()
         
-        mermaid_diagram += "\n```\n"
-        return mermaid_diagram
+        yield "\n```\n"
 
-    def _generate_class_relations(self) -> str:
+    def _iter_class_relations(self) -> Iterator[str]:
         """
-        Génère les relations entre classes et énumérations avec une protection contre la récursion infinie
+        Produit les relations entre classes et énumérations collectées lors du parcours du schéma
 
-        :return: Chaîne de relations Mermaid
+        :return: Itérateur sur les lignes de relations Mermaid
         """
-        relations = ""
-        processed_relations = set()
-        
-        def process_type_relations(type_schema, parent_name=None, depth=0):
-            nonlocal relations
-            
-            # Protection contre la récursion profonde
-            if depth > 10:
-                return
-            
-            # Gestion des types unions
-            if isinstance(type_schema, list):
-                for sub_type in type_schema:
-                    process_type_relations(sub_type, parent_name, depth + 1)
-                return
-            
-            if not hasattr(type_schema, 'type'):
-                return
-            
-            if type_schema.type == 'record':
-                # Relations pour les champs qui sont des sous-records ou des enums
-                for field in type_schema.fields:
-                    # Vérifier si le type du champ est un record ou un enum
-                    if hasattr(field.type, 'type'):
-                        if field.type.type == 'record' and hasattr(field.type, 'name'):
-                            # Relation avec un sous-record
-                            relation_key = (type_schema.name, field.type.name, field.name, 'record')
-                            if relation_key not in processed_relations:
-                                relations += f"    {type_schema.name} --> {field.type.name} : {field.name}\n"
-                                processed_relations.add(relation_key)
-                        
-                        elif field.type.type == 'enum' and hasattr(field.type, 'name'):
-                            # Relation avec une énumération
-                            relation_key = (type_schema.name, field.type.name, field.name, 'enum')
-                            if relation_key not in processed_relations:
-                                relations += f"    {type_schema.name} ..> {field.type.name} : {field.name}\n"
-                                processed_relations.add(relation_key)
-                        
-                        # Analyse récursive des sous-types
-                        process_type_relations(field.type, type_schema.name, depth + 1)
-                    
-                    # Gestion des types tableau
-                    elif isinstance(field.type, list):
-                        for sub_type in field.type:
-                            if hasattr(sub_type, 'type'):
-                                if sub_type.type == 'record':
-                                    # Relation avec un record dans un tableau
-                                    relation_key = (type_schema.name, sub_type.name, field.name, 'record_list')
-                                    if relation_key not in processed_relations:
-                                        relations += f"    {type_schema.name} --> {sub_type.name} : {field.name}\n"
-                                        processed_relations.add(relation_key)
-                                
-                                elif sub_type.type == 'enum':
-                                    # Relation avec une énumération dans un tableau
-                                    relation_key = (type_schema.name, sub_type.name, field.name, 'enum_list')
-                                    if relation_key not in processed_relations:
-                                        relations += f"    {type_schema.name} ..> {sub_type.name} : {field.name}\n"
-                                        processed_relations.add(relation_key)
-            
-            elif type_schema.type == 'array':
-                # Relations pour les tableaux de records ou d'enums
-                if hasattr(type_schema.items, 'type'):
-                    if type_schema.items.type == 'record' and hasattr(type_schema.items, 'name'):
-                        # Relation avec un record dans un tableau
-                        if parent_name:
-                            relation_key = (parent_name, type_schema.items.name, 'array_record')
-                            if relation_key not in processed_relations:
-                                relations += f"    {parent_name} --> {type_schema.items.name} : {type_schema.items.name} liste\n"
-                                processed_relations.add(relation_key)
-                    
-                    elif type_schema.items.type == 'enum' and hasattr(type_schema.items, 'name'):
-                        # Relation avec une énumération dans un tableau
-                        if parent_name:
-                            relation_key = (parent_name, type_schema.items.name, 'array_enum')
-                            if relation_key not in processed_relations:
-                                relations += f"    {parent_name} ..> {type_schema.items.name} : {type_schema.items.name} liste\n"
-                                processed_relations.add(relation_key)
-                    
-                    # Analyse récursive des éléments du tableau
-                    process_type_relations(type_schema.items, parent_name, depth + 1)
-
-        # Commencer par le schéma principal
-        process_type_relations(self.schema)
+        for source, target, label, arrow in self.plan.relations:
+            yield f"    {source} {arrow} {target} : {label}\n"
+
+    def _add_relation(self, source: str, target: str, label: str, kind: str, arrow: str):
+        """
+        Enregistre une relation Mermaid si elle n'a pas déjà été rencontrée
+
+        :param source: Nom de la classe source
+        :param target: Nom de la classe cible
+        :param label: Libellé de la relation
+        :param kind: Nature de la relation (record, enum, record_list, ...)
+        :param arrow: Flèche Mermaid à utiliser
+        """
+        source = sys.intern(source)
+        target = sys.intern(target)
         
-        return relations
-    
+        # Clé entière compacte : indices des noms et du libellé, puis nature de la relation
+        relation_key = (
+            (self.name_index.setdefault(source, len(self.name_index)) << 44)
+            | (self.name_index.setdefault(target, len(self.name_index)) << 24)
+            | (self.label_index.setdefault(label, len(self.label_index)) << 4)
+            | _RELATION_KINDS[kind]
+        )
+        if relation_key not in self.processed_relations:
+            self.relations.append((source, target, label, arrow))
+            self.processed_relations.add(relation_key)
+
     def _get_mermaid_field_type(self, field_type: Any) -> str:
         """
         Convertit un type Avro en type compatible Mermaid
@@ -161,20 +257,16 @@ class AvroDocumentationGenerator:
         :param type_schema: Schéma de type Avro
         :return: Type Mermaid
         """
-        if isinstance(type_schema, str):
-            return type_schema
+        type_schema = self._resolve(type_schema)
         
-        if hasattr(type_schema, 'type'):
-            if type_schema.type == 'record':
-                return f"{type_schema.name}"
-            elif type_schema.type == 'enum':
-                return f"{type_schema.name}"
-            elif type_schema.type == 'array':
-                return f"List<{self._get_single_mermaid_type(type_schema.items)}>"
-            elif type_schema.type == 'map':
-                return f"Map<{self._get_single_mermaid_type(type_schema.values)}>"
-        
-        return str(type_schema)
+        # Les noeuds de type sont partagés entre les champs : le rendu est mémorisé par noeud
+        mermaid_type = self.mermaid_type_cache.get(id(type_schema))
+        if mermaid_type is None:
+            formatter = _MERMAID_TYPE_FORMATTERS.get(_get(type_schema, 'type'))
+            # Sans logicalType : des parenthèses feraient du membre une méthode pour Mermaid
+            mermaid_type = formatter(self, type_schema) if formatter else self._format_other_type(type_schema, with_logical_type=False)
+            self.mermaid_type_cache[id(type_schema)] = mermaid_type
+        return mermaid_type
 
 
     def generate_markdown_documentation(self) -> str:
@@ -183,154 +275,251 @@ class AvroDocumentationGenerator:
 
         :return: Contenu de la documentation au format Markdown
         """
-        # Réinitialise les dictionnaires de records et enums
-        self.records = {}
-        self.enums = {}
-        self.processed_types = set()
+        return "".join(self.iter_markdown())
 
-        # Analyse récursive pour extraire les sous-objets et enums
-        self._extract_nested_types(self.schema)
+    def iter_markdown(self) -> Iterator[str]:
+        """
+        Produit la documentation Markdown section par section, sans construire le document complet
+
+        :return: Itérateur sur les fragments de la documentation Markdown
+        """
+        plan = self.plan
 
         # Génération de la documentation principale
-        doc = f"# Documentation du Schéma Avro\n\n"
+        yield "# Documentation du Schéma Avro\n\n"
 
         # Ajouter le diagramme de classe Mermaid
-        doc += "## Structure du Schéma\n\n"
-        doc += self.generate_mermaid_class_diagram()
-        doc += "\n"
+        yield "## Structure du Schéma\n\n"
+        yield from self.iter_mermaid_class_diagram()
+        yield "\n"
         
         # Informations du schéma principal
-        doc += f"## Schéma Principal: {self.schema.name}\n"
-        doc += f"- **Namespace**: {self.schema.namespace}\n"
-        doc += f"- **Type**: {self.schema.type}\n"
+        yield f"## Schéma Principal: {plan.name}\n"
+        yield f"- **Namespace**: {plan.namespace}\n"
+        yield f"- **Type**: {plan.type}\n"
         
-        if self.schema.doc:
-            doc += f"- **Description**: {self.schema.doc}\n\n"
+        if plan.doc:
+            yield f"- **Description**: {plan.doc}\n\n"
 
         # Structure des champs principaux
-        doc += "### Structure des Champs\n\n"
-        doc += self._parse_record_fields(self.schema)
+        yield "### Structure des Champs\n\n"
+        yield from self._parse_record_fields(plan.fields)
 
         # Sous-objets Records
-        if self.records:
-            doc += "\n## Définition Détaillée des Sous-Objets\n\n"
-            for name, record_schema in self.records.items():
-                doc += f"### Sous-Objet: {name}\n\n"
+        if plan.record_names:
+            yield "\n## Définition Détaillée des Sous-Objets\n\n"
+            for name, record_doc, fields in zip(plan.record_names, plan.record_docs, plan.record_fields):
+                yield f"### Sous-Objet: {name}\n\n"
                 
                 # Description du sous-objet
-                if record_schema.doc:
-                    doc += f"**Description**: {record_schema.doc}\n\n"
+                if record_doc:
+                    yield f"**Description**: {record_doc}\n\n"
                 
                 # Champs du sous-objet
-                doc += "#### Champs\n\n"
-                doc += self._parse_record_fields(record_schema, is_detailed=True)
+                yield "#### Champs\n\n"
+                yield from self._parse_record_fields(fields, is_detailed=True)
 
         # Énumérations
-        if self.enums:
-            doc += "\n## Énumérations\n\n"
-            for name, enum_schema in self.enums.items():
-                doc += f"### Énumération: {name}\n\n"
+        if plan.enum_names:
+            yield "\n## Énumérations\n\n"
+            for name, enum_doc, symbols in zip(plan.enum_names, plan.enum_docs, plan.enum_symbols):
+                yield f"### Énumération: {name}\n\n"
                 
                 # Description de l'énumération
-                if enum_schema.doc:
-                    doc += f"**Description**: {enum_schema.doc}\n\n"
+                if enum_doc:
+                    yield f"**Description**: {enum_doc}\n\n"
                 
                 # Valeurs de l'énumération
-                doc += "**Valeurs possibles**:\n"
-                doc += "\n".join([f"- `{symbol}`" for symbol in enum_schema.symbols])
-                doc += "\n\n"
+                yield "**Valeurs possibles**:\n"
+                for symbol in symbols:
+                    yield f"- `{symbol}`\n"
+                yield "\n"
 
-        return doc
+    def _build_plan(self) -> _SchemaPlan:
+        """
+        Parcourt le schéma Avro et le réduit à une représentation à plat prête à être rendue
 
-    def _extract_nested_types(self, schema: avro.schema.Schema):
+        :return: Plan du schéma
+        """
+        # Réinitialise les dictionnaires de records, enums et types déjà rendus
+        self.records = {}
+        self.enums = {}
+        self.anchors = {}
+        self.relations = []
+        self.processed_relations = set()
+        self.name_index = {}
+        self.label_index = {}
+        self.seen_names = set()
+        self.seen_ids = set()
+        self.type_name_cache = {}
+        self.mermaid_type_cache = {}
+
+        # Parcours unique pour extraire les sous-objets, enums et relations
+        if _get(self.schema, 'type') == 'record':
+            self._walk(self.schema)
+
+        # fastavro qualifie les noms : l'espace de noms est la partie préfixe du nom complet
+        namespace, _, name = _get(self.schema, 'name').rpartition('.')
+        records = list(self.records.values())
+        enums = list(self.enums.values())
+        return _SchemaPlan(
+            name=name,
+            namespace=namespace or None,
+            type=_get(self.schema, 'type'),
+            doc=_get(self.schema, 'doc'),
+            fields=self._lower_record_fields(self.schema),
+            record_names=list(self.records),
+            record_docs=[_get(record_schema, 'doc') for record_schema in records],
+            record_fields=[self._lower_record_fields(record_schema) for record_schema in records],
+            enum_names=list(self.enums),
+            enum_docs=[_get(enum_schema, 'doc') for enum_schema in enums],
+            enum_symbols=[list(_get(enum_schema, 'symbols')) for enum_schema in enums],
+            relations=self.relations,
+        )
+
+    def _walk(self, schema: Dict[str, Any]):
         """
-        Extrait récursivement les sous-objets records et enums
+        Parcourt les champs d'un record en une seule passe, à l'aide d'une pile explicite :
+        enregistre les sous-objets records et enums rencontrés et collecte les relations entre classes
 
-        :param schema: Schéma Avro à analyser
+        :param schema: Schéma du record à analyser
         """
-        def _extract_from_type(type_schema):
-            # Vérification pour éviter la récursion infinie
-            if id(type_schema) in self.processed_types:
-                return
+        # Chaque entrée : (type, nom du record parent, nom du champ porteur)
+        root_name = sys.intern(_short_name(_get(schema, 'name')))
+        stack = [(_get(field, 'type'), root_name, _get(field, 'name')) for field in reversed(_get(schema, 'fields'))]
+        
+        while stack:
+            type_schema, parent_name, field_name = stack.pop()
+            type_schema = self._resolve(type_schema)
+            type_name = _get(type_schema, 'type')
             
-            self.processed_types.add(id(type_schema))
-
-            # Extraction pour un type donné
-            if isinstance(type_schema, list):
-                # Gère les types union
-                for sub_type in type_schema:
-                    _extract_from_type(sub_type)
-                return
-
-            if hasattr(type_schema, 'type'):
-                if type_schema.type == 'record':
-                    if hasattr(type_schema, 'name') and type_schema.name not in self.records:
-                        self.records[type_schema.name] = type_schema
-                    
-                    # Analyse récursive des champs du record
-                    for field in type_schema.fields:
-                        _extract_from_type(field.type)
+            # Relations portées par un champ du record parent
+            if field_name is not None:
+                if type_name == 'record' or type_name == 'enum':
+                    # Relation avec un sous-record ou une énumération
+                    kind, arrow = ('record', '-->') if type_name == 'record' else ('enum', '..>')
+                    self._add_relation(parent_name, _short_name(_get(type_schema, 'name')), field_name, kind, arrow)
                 
-                elif type_schema.type == 'enum':
-                    if hasattr(type_schema, 'name'):
-                        self.enums[type_schema.name] = type_schema
+                elif isinstance(type_schema, list):
+                    for sub_type in map(self._resolve, type_schema):
+                        sub_type_name = _get(sub_type, 'type')
+                        if sub_type_name == 'record':
+                            self._add_relation(parent_name, _short_name(_get(sub_type, 'name')), field_name, 'record_list', '-->')
+                        elif sub_type_name == 'enum':
+                            self._add_relation(parent_name, _short_name(_get(sub_type, 'name')), field_name, 'enum_list', '..>')
+            
+            # Vérification pour éviter la récursion infinie : les types nommés sont
+            # identifiés par leur nom complet, les types anonymes par leur identité
+            if type_name == 'record' or type_name == 'enum':
+                fullname = _get(type_schema, 'name')
+                if fullname in self.seen_names:
+                    continue
+                self.seen_names.add(fullname)
+            else:
+                if id(type_schema) in self.seen_ids:
+                    continue
+                self.seen_ids.add(id(type_schema))
+            
+            # Gestion des types unions
+            if isinstance(type_schema, list):
+                stack.extend((sub_type, parent_name, None) for sub_type in reversed(type_schema))
+            
+            elif type_name == 'record':
+                # Les noms sont internés : ils reviennent dans les clés, les relations et les types rendus
+                record_name = sys.intern(_short_name(_get(type_schema, 'name')))
+                if record_name not in self.records:
+                    self.records[record_name] = type_schema
+                    self.anchors[record_name] = f"#sous-objet-{record_name.lower()}"
                 
-                elif type_schema.type == 'array':
-                    # Pour les tableaux, analyse le type des éléments
-                    _extract_from_type(type_schema.items)
+                # Analyse des champs du record
+                stack.extend(
+                    (_get(field, 'type'), record_name, _get(field, 'name'))
+                    for field in reversed(_get(type_schema, 'fields'))
+                )
+            
+            elif type_name == 'enum':
+                enum_name = sys.intern(_short_name(_get(type_schema, 'name')))
+                self.enums[enum_name] = type_schema
+                self.anchors[enum_name] = f"#énumération-{enum_name.lower()}"
+            
+            elif type_name == 'array':
+                items = self._resolve(_get(type_schema, 'items'))
+                items_type = _get(items, 'type')
+                # Relations pour les tableaux de records ou d'enums
+                if parent_name and (items_type == 'record' or items_type == 'enum'):
+                    items_name = _short_name(_get(items, 'name'))
+                    if items_type == 'record':
+                        self._add_relation(parent_name, items_name, f"{items_name} liste", 'array_record', '-->')
+                    else:
+                        self._add_relation(parent_name, items_name, f"{items_name} liste", 'array_enum', '..>')
                 
-                elif type_schema.type == 'map':
-                    # Pour les maps, analyse le type des valeurs
-                    _extract_from_type(type_schema.values)
-
-        # Analyse de chaque champ du schéma principal
-        if schema.type == 'record':
-            for field in schema.fields:
-                _extract_from_type(field.type)
+                # Pour les tableaux, analyse le type des éléments
+                stack.append((items, parent_name, None))
+            
+            elif type_name == 'map':
+                # Pour les maps, analyse le type des valeurs
+                stack.append((_get(type_schema, 'values'), None, None))
 
-    def _parse_record_fields(self, schema: avro.schema.Schema, indent: int = 0, is_detailed: bool = False) -> str:
+    def _lower_record_fields(self, schema: Dict[str, Any]) -> List[_FieldPlan]:
         """
-        Analyse les champs d'un schéma Avro
+        Précalcule les informations affichées pour chaque champ d'un record
 
         :param schema: Schéma Avro à analyser
-        :param indent: Niveau d'indentation pour la mise en forme
-        :param is_detailed: Indicateur pour un affichage détaillé
-        :return: Documentation Markdown des champs
+        :return: Liste des champs du record
         """
-        doc = ""
-        if schema.type == 'record':
-            for field in schema.fields:
-                # Nom du champ
-                doc += f"**{field.name}**\n"
-                
-                # Type du champ
-                field_type = self._get_field_type(field.type)
-                doc += f"- **Type**: {field_type}\n"
-                
-                # Documentation du champ si disponible
-                if field.doc:
-                    doc += f"- **Description**: {field.doc}\n"
+        fields = []
+        if _get(schema, 'type') == 'record':
+            for field in _get(schema, 'fields'):
+                field_type = _get(field, 'type')
                 
                 # Gestion des valeurs par défaut
-                try:
-                    if 'default' in field.__dict__:
-                        default_value = field.default
-                        doc += f"- **Valeur par défaut**: `{default_value}`\n"
-                except Exception:
-                    # Si la récupération de la valeur par défaut échoue
-                    doc += "- **Valeur par défaut**: Non spécifiée\n"
+                default = _get(field, 'default', _MISSING)
                 
-                # Pour un affichage détaillé, ajouter plus d'informations
-                if is_detailed:
-                    # Vérifier le type
-                    if isinstance(field.type, dict) and field.type.get('type') == 'record' and 'name' in field.type:
-                        doc += f"- **Sous-Type**: [Voir définition de {field.type['name']}](#sous-objet-{field.type['name'].lower()})\n"
-                    elif isinstance(field.type, dict) and field.type.get('type') == 'enum' and 'name' in field.type:
-                        doc += f"- **Énumération**: [Voir définition de {field.type['name']}](#énumération-{field.type['name'].lower()})\n"
+                # Lien vers la définition du sous-type, via les ancres calculées lors du parcours
+                link = None
+                resolved_type = self._resolve(field_type)
+                if _get(resolved_type, 'type') == 'record':
+                    name = _short_name(_get(resolved_type, 'name'))
+                    link = f"- **Sous-Type**: [Voir définition de {name}]({self.anchors[name]})\n"
+                elif _get(resolved_type, 'type') == 'enum':
+                    name = _short_name(_get(resolved_type, 'name'))
+                    link = f"- **Énumération**: [Voir définition de {name}]({self.anchors[name]})\n"
                 
-                doc += "\n"
-        
-        return doc
+                fields.append(_FieldPlan(
+                    name=_get(field, 'name'),
+                    mermaid_type=self._get_mermaid_field_type(field_type),
+                    type_name=self._get_field_type(field_type),
+                    doc=_get(field, 'doc'),
+                    default=_json_dumps(default) if default is not _MISSING else None,
+                    link=link,
+                ))
+        return fields
+
+    def _parse_record_fields(self, fields: List[_FieldPlan], is_detailed: bool = False) -> Iterator[str]:
+        """
+        Produit la documentation des champs d'un record
+
+        :param fields: Champs précalculés du record
+        :param is_detailed: Indicateur pour un affichage détaillé
+        :return: Itérateur sur les fragments Markdown des champs
+        """
+        for field in fields:
+            # Nom et type du champ
+            yield f"**{field.name}**\n"
+            yield f"- **Type**: {field.type_name}\n"
+            
+            # Documentation du champ si disponible
+            if field.doc:
+                yield f"- **Description**: {field.doc}\n"
+            
+            if field.default is not None:
+                yield f"- **Valeur par défaut**: `{field.default}`\n"
+            
+            # Pour un affichage détaillé, ajouter le lien vers la définition du sous-type
+            if is_detailed and field.link:
+                yield field.link
+            
+            yield "\n"
 
     def _get_field_type(self, field_type: Any) -> str:
         """
@@ -353,50 +542,145 @@ class AvroDocumentationGenerator:
         :param type_schema: Schéma de type Avro
         :return: Nom du type lisible
         """
+        type_schema = self._resolve(type_schema)
+        
+        # Les noeuds de type sont partagés entre les champs : le rendu est mémorisé par noeud
+        type_name = self.type_name_cache.get(id(type_schema))
+        if type_name is None:
+            formatter = _TYPE_NAME_FORMATTERS.get(_get(type_schema, 'type'))
+            type_name = formatter(self, type_schema) if formatter else self._format_other_type(type_schema)
+            self.type_name_cache[id(type_schema)] = type_name
+        return type_name
+
+    def _resolve(self, type_schema: Any) -> Any:
+        """
+        Remplace une référence à un type nommé par sa définition
+
+        :param type_schema: Schéma de type Avro, éventuellement un nom de type
+        :return: Définition du type référencé, ou le type inchangé
+        """
+        if isinstance(type_schema, str):
+            return self.named_schemas.get(type_schema, type_schema)
+        return type_schema
+
+    @staticmethod
+    def _format_other_type(type_schema: Any, with_logical_type: bool = True) -> str:
+        """
+        Rend un type sans formateur dédié : primitif, éventuellement enveloppé dans un
+        dictionnaire ({"type": "string"}) ou annoté d'un logicalType
+
+        :param type_schema: Schéma de type Avro
+        :param with_logical_type: Indique si le logicalType est ajouté au nom du type
+        :return: Nom du type primitif, ou sa définition JSON pour un type non reconnu
+        """
         if isinstance(type_schema, str):
             return type_schema
         
-        if hasattr(type_schema, 'type'):
-            if type_schema.type == 'record':
-                return f"Record ({type_schema.name})"
-            elif type_schema.type == 'enum':
-                return f"Enum ({type_schema.name})"
-            elif type_schema.type == 'array':
-                return f"Tableau de {self._get_single_type_name(type_schema.items)}"
-            elif type_schema.type == 'map':
-                return f"Map de {self._get_single_type_name(type_schema.values)}"
+        base_type = _get(type_schema, 'type')
+        if isinstance(base_type, str):
+            logical_type = _get(type_schema, 'logicalType')
+            if logical_type and with_logical_type:
+                return f"{base_type} ({logical_type})"
+            return base_type
         
-        return str(type_schema)
+        return _json_dumps(type_schema)
 
-    def save_documentation(self, content: str):
+    def save_documentation(self, content: Optional[str] = None, file_name: str = 'avro_schema_doc.md'):
         """
         Sauvegarde la documentation générée dans un fichier
 
-        :param content: Contenu de la documentation
+        :param content: Contenu de la documentation ; si absent, la documentation
+            est générée et écrite au fil de l'eau
+        :param file_name: Nom du fichier de documentation dans le répertoire de sortie
         """
-        os.makedirs(self.output_dir, exist_ok=True)
-        output_file = os.path.join(self.output_dir, 'avro_schema_doc.md')
+        output_dir = Path(self.output_dir)
+        output_dir.mkdir(parents=True, exist_ok=True)
+        output_file = output_dir / file_name
         
-        with open(output_file, 'w', encoding='utf-8') as f:
-            f.write(content)
+        # Écriture binaire avec un tampon large : l'encodage UTF-8 est fait une fois
+        # par fragment et les appels système sont regroupés
+        with open(output_file, 'wb', buffering=_WRITE_BUFFER_SIZE) as f:
+            if content is None:
+                for chunk in self.iter_markdown():
+                    f.write(chunk.encode('utf-8'))
+            else:
+                f.write(content.encode('utf-8'))
         
         print(f"Documentation générée : {output_file}")
 
+def _generate_one(schema_file: str, output_dir: str, file_name: str):
+    """
+    Génère et sauvegarde la documentation d'un fichier de schéma (exécuté dans un processus de travail)
+
+    :param schema_file: Chemin vers le fichier de schéma Avro
+    :param output_dir: Répertoire de sortie pour la documentation
+    :param file_name: Nom du fichier de documentation
+    """
+    AvroDocumentationGenerator(schema_file, output_dir).save_documentation(file_name=file_name)
+
+def _positive_int(value: str) -> int:
+    """
+    Valide un argument de ligne de commande entier strictement positif
+
+    :param value: Valeur brute de l'argument
+    :return: Valeur entière
+    """
+    try:
+        number = int(value)
+    except ValueError:
+        raise argparse.ArgumentTypeError(f"entier attendu : {value!r}")
+    if number < 1:
+        raise argparse.ArgumentTypeError(f"doit être supérieur ou égal à 1 : {number}")
+    return number
+
 def main():
     parser = argparse.ArgumentParser(description='Générateur de documentation Avro')
-    parser.add_argument('schema_file', help='Chemin vers le fichier de schéma Avro')
+    parser.add_argument('schema_file', nargs='+', help='Chemin(s) vers le(s) fichier(s) de schéma Avro')
     parser.add_argument('--output', default='docs', help='Répertoire de sortie pour la documentation')
+    parser.add_argument('--batch', action='store_true',
+                        help='Mode lot : un fichier <schéma>_doc.md par schéma, quel que soit leur nombre')
+    parser.add_argument('--jobs', type=_positive_int, default=None,
+                        help='Nombre de processus du mode lot (défaut : nombre de CPU)')
     
     args = parser.parse_args()
 
-    try:
-        generator = AvroDocumentationGenerator(args.schema_file, args.output)
-        documentation = generator.generate_markdown_documentation()
-        generator.save_documentation(documentation)
-    except Exception as e:
-        print(f"Erreur lors de la génération de la documentation : {e}")
-        import traceback
-        traceback.print_exc()
+    # Le nom du fichier produit ne doit pas dépendre du nombre de schémas reçus
+    # (ex. un motif schemas/*.avsc) : plusieurs schémas exigent le mode lot explicite
+    if not args.batch and len(args.schema_file) > 1:
+        parser.error("plusieurs fichiers de schéma nécessitent l'option --batch")
+
+    if not args.batch:
+        try:
+            _generate_one(args.schema_file[0], args.output, 'avro_schema_doc.md')
+        except Exception as e:
+            print(f"Erreur lors de la génération de la documentation : {e}")
+            import traceback
+            traceback.print_exc()
+            exit(1)
+        return
+
+    # Un fichier de documentation par schéma, nommé d'après le fichier source :
+    # deux schémas de même nom s'écraseraient dans le répertoire de sortie
+    file_names = {}
+    for path in args.schema_file:
+        file_name = f"{os.path.splitext(os.path.basename(path))[0]}_doc.md"
+        if file_name in file_names:
+            parser.error(f"{path} et {file_names[file_name]} produiraient tous deux {file_name}")
+        file_names[file_name] = path
+
+    failed = False
+    with ProcessPoolExecutor(max_workers=args.jobs) as executor:
+        futures = {
+            executor.submit(_generate_one, path, args.output, file_name): path
+            for file_name, path in file_names.items()
+        }
+        for future in as_completed(futures):
+            try:
+                future.result()
+            except Exception as e:
+                print(f"Erreur lors de la génération de la documentation de {futures[future]} : {e}")
+                failed = True
+    if failed:
         exit(1)
 
 if __name__ == '__main__':